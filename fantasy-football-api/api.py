@@ -1,14 +1,69 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+from typing import List, Literal, NamedTuple, TypedDict
+import asyncio
+import hashlib
+import logging
 import os
+import tempfile
+import time
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 from espn_api.football import League
-from pydantic import BaseModel
+
+try:
+    import fcntl
+except ImportError:  # Windows: every worker refreshes from ESPN on its own
+    fcntl = None
 
 load_dotenv()
 
-app = FastAPI(title="Fantasy Football Matrix API", version="1.0.0")
+logger = logging.getLogger(__name__)
+
+# Refresh configuration (seconds)
+REFRESH_INTERVAL = int(os.getenv("REFRESH_INTERVAL", "30"))  # Matches the matrix REFRESH_INTERVAL
+LEAGUE_TTL = int(os.getenv("LEAGUE_TTL", "3600"))  # Reload league so current_week rolls over
+
+# Shared between uvicorn workers: one holds the lock and calls ESPN, the rest read its file
+SHARED_POLL_INTERVAL = 1  # Followers only stat the file, so they can check often
+# The default name is per league and season so separate deployments on one host don't share a refresher
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH") or os.path.join(
+    tempfile.gettempdir(),
+    f"fantasy-matrix-{os.getenv('ESPN_LEAGUE_ID', 'league')}-{os.getenv('ESPN_YEAR', '2025')}.json",
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Keep a league snapshot fresh in the background while the app is running
+    """
+    app.state.snapshot = None
+    app.state.refresh_error = None
+    app.state.first_refresh = asyncio.Event()
+    app.state.refresh_lock = None
+    app.state.standalone = False  # Set if the shared files can't be used
+    app.state.shared_mtime = None
+
+    refresher = asyncio.create_task(refresh_snapshot_loop(app))
+    yield
+    refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresher
+    if app.state.refresh_lock is not None:
+        app.state.refresh_lock.close()
+
+
+app = FastAPI(
+    title="Fantasy Football Matrix API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Add CORS middleware for matrix portal access
 app.add_middleware(
@@ -19,14 +74,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-class TeamInMatchup(BaseModel):
+# Compress larger JSON payloads for clients that send Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=6)
+
+class TeamInMatchup(TypedDict):
     team_id: int
     team_abbrev: str  # 4-char abbreviation for matrix display
     team_name: str
     current_score: float
     projected_score: float
 
-class MatchupData(BaseModel):
+class MatchupData(TypedDict):
     matchup_index: int  # 0-based index for matrix cycling (0-5 for 12-team league)
     home_team: TeamInMatchup
     away_team: TeamInMatchup
@@ -34,13 +92,68 @@ class MatchupData(BaseModel):
     away_win_probability: float  # 0.0 to 1.0
     is_complete: bool
     
-class MatrixData(BaseModel):
+class MatrixData(TypedDict):
     matchups: List[MatchupData]
     week: int
     league_name: str
     total_matchups: int
+    live_median: float
     projected_median: float
 
+# Slim variants carry only what the matrix display reads, with scores
+# as integer tenths so the device never formats floats
+class SlimTeamInMatchup(TypedDict):
+    team_abbrev: str
+    score_tenths: int  # current_score * 10
+
+class SlimMatchupData(TypedDict):
+    matchup_index: int
+    home_team: SlimTeamInMatchup
+    away_team: SlimTeamInMatchup
+    home_win_probability: float
+
+class SlimMatrixData(TypedDict):
+    matchups: List[SlimMatchupData]
+    week: int
+    live_median_tenths: int
+    projected_median_tenths: int
+
+# Split variants: identity that only changes with the week, and the
+# fast-changing numbers as parallel arrays indexed by matchup_index
+class TeamSummary(TypedDict):
+    team_id: int
+    team_abbrev: str
+    team_name: str
+
+class MatchupSummary(TypedDict):
+    matchup_index: int
+    home_team: TeamSummary
+    away_team: TeamSummary
+
+class MatrixDataSummary(TypedDict):
+    matchups: List[MatchupSummary]
+    week: int
+    league_name: str
+
+class MatrixDataScores(TypedDict):
+    week: int  # Lets clients notice a new week and refetch the summary
+    home_score_tenths: List[int]
+    away_score_tenths: List[int]
+    home_win_probability: List[float]
+    live_median_tenths: int
+    projected_median_tenths: int
+
+class Payload(NamedTuple):
+    body: bytes  # Pre-serialized JSON response
+    etag: str  # Weak quoted hash of body for conditional requests
+
+class LeagueSnapshot(NamedTuple):
+    matrix_data: MatrixData
+    full: Payload
+    slim: Payload
+    summary: Payload
+    scores: Payload
+
 @app.get("/")
 async def root():
     return {"message": "Fantasy Football Matrix API", "status": "running"}
@@ -65,18 +178,46 @@ def get_league() -> League:
         return League(league_id=league_id, year=year)
 
 
+_LEAGUE: League | None = None
+_league_loaded_at = 0.0
+
+# Home/away scores and projections, reused between refreshes
+_score_buffer = np.empty((4, 0))
+
+
+def get_shared_league() -> League:
+    """
+    Return the module-level league instance, creating it on first use
+    and reloading it every LEAGUE_TTL seconds to pick up week changes
+    """
+    global _LEAGUE, _league_loaded_at
+
+    now = time.monotonic()
+    if _LEAGUE is None or now - _league_loaded_at > LEAGUE_TTL:
+        _LEAGUE = get_league()
+        _league_loaded_at = now
+    return _LEAGUE
+
+
+def get_score_buffer(count: int) -> np.ndarray:
+    """
+    Return the shared (4, count) score array, reallocating only if the league size changed
+    """
+    global _score_buffer
+
+    if _score_buffer.shape[1] != count:
+        _score_buffer = np.empty((4, count))
+    return _score_buffer
+
 
-def calculate_win_probability(home_score: float, away_score: float, 
-                            home_proj: float, away_proj: float) -> tuple[float, float]:
+def calculate_win_probabilities(home_scores: np.ndarray, away_scores: np.ndarray,
+                                home_proj: np.ndarray, away_proj: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
-    Calculate win probability based on current scores and projections
+    Calculate win probabilities for every matchup based on current scores and projections
     Simple algorithm: factor in both current lead and projection advantage
     """
-    if home_proj + away_proj == 0:
-        return 0.5, 0.5
-    
     # Current score advantage (30% weight)
-    score_diff = home_score - away_score
+    score_diff = home_scores - away_scores
     
     # Projection advantage (70% weight) 
     proj_diff = home_proj - away_proj
@@ -84,87 +225,371 @@ def calculate_win_probability(home_score: float, away_score: float,
     # Combined advantage
     total_advantage = (score_diff * 0.3) + (proj_diff * 0.7)
     
-    # Convert to probability using sigmoid-like function
-    # Normalize by total projected points for scaling
+    # Convert to probability using a logistic sigmoid
+    # Normalize by total projected points for scaling; matchups without
+    # projections keep a zero advantage, which maps to an even 50/50
     total_proj = home_proj + away_proj
-    if total_proj > 0:
-        normalized_advantage = total_advantage / (total_proj * 0.1)  # Scale factor
-        home_prob = 1 / (1 + pow(2.71828, -normalized_advantage))
-    else:
-        home_prob = 0.5
+    normalized_advantage = np.divide(
+        total_advantage, total_proj * 0.1,  # Scale factor
+        out=np.zeros_like(total_advantage), where=total_proj > 0
+    )
+    home_prob = 1 / (1 + np.exp(-normalized_advantage))
     
     away_prob = 1.0 - home_prob
     
-    return round(home_prob, 3), round(away_prob, 3)
+    return np.round(home_prob, 3), np.round(away_prob, 3)
 
-@app.get("/league/data", response_model=MatrixData)
-async def get_league_data() -> MatrixData:
+
+def calculate_median(values: np.ndarray) -> float:
     """
-    Internal function to fetch league data from ESPN API
+    Median rounded for display, or 0.0 when there are no teams
     """
-    try:
-        league = get_league()
-        current_week = league.current_week
-        box_scores = league.box_scores(week=current_week)
-
-        matchups_data = []
-        for i, box in enumerate(box_scores):
-            home_team = box.home_team
-            away_team = box.away_team
-
-            # Get current scores and projections from box score
-            home_score = round(box.home_score, 1)
-            away_score = round(box.away_score, 1)
-            home_proj = round(box.home_projected, 1)
-            away_proj = round(box.away_projected, 1)
-
-            # Calculate win probabilities
-            home_win_prob, away_win_prob = calculate_win_probability(
-                home_score, away_score, home_proj, away_proj
-            )
-
-            matchup_data = MatchupData(
-                matchup_index=i,
-                home_team=TeamInMatchup(
-                    team_id=home_team.team_id,
-                    team_abbrev=home_team.team_abbrev,
-                    team_name=home_team.team_name,
-                    current_score=home_score,
-                    projected_score=home_proj
-                ),
-                away_team=TeamInMatchup(
-                    team_id=away_team.team_id,
-                    team_abbrev=away_team.team_abbrev,
-                    team_name=away_team.team_name,
-                    current_score=away_score,
-                    projected_score=away_proj
-                ),
-                home_win_probability=home_win_prob,
-                away_win_probability=away_win_prob,
-                is_complete=box.is_playoff  # Using is_playoff as proxy since box doesn't have is_complete
-            )
-            matchups_data.append(matchup_data)
-
-        # Calculate projected median from all teams
-        all_projections = []
-        for matchup in matchups_data:
-            all_projections.append(matchup.home_team.projected_score)
-            all_projections.append(matchup.away_team.projected_score)
-        
-        sorted_projections = sorted(all_projections)
-        n = len(sorted_projections)
-        projected_median = sorted_projections[n // 2] if n % 2 else (sorted_projections[n // 2 - 1] + sorted_projections[n // 2]) / 2
-
-        return MatrixData(
-            matchups=matchups_data,
-            week=current_week,
-            league_name=league.settings.name,
-            total_matchups=len(matchups_data),
-            projected_median=round(projected_median, 1)
+    if values.size == 0:
+        return 0.0
+    return round(float(np.median(values)), 1)
+
+
+def build_matrix_data() -> MatrixData:
+    """
+    Fetch the current week's box scores from ESPN and assemble matrix data
+    """
+    league = get_shared_league()
+    current_week = league.current_week
+    box_scores = league.box_scores(week=current_week)
+
+    # Single pass over the espn_api objects: numbers go into one reusable
+    # (4, n) array, team identity into a parallel list
+    count = len(box_scores)
+    scores = get_score_buffer(count)
+    teams = []
+    for i, box in enumerate(box_scores):
+        home_team = box.home_team
+        away_team = box.away_team
+        scores[:, i] = (
+            round(box.home_score, 1),
+            round(box.away_score, 1),
+            round(box.home_projected, 1),
+            round(box.away_projected, 1),
         )
+        teams.append((
+            {"team_id": home_team.team_id, "team_abbrev": home_team.team_abbrev, "team_name": home_team.team_name},
+            {"team_id": away_team.team_id, "team_abbrev": away_team.team_abbrev, "team_name": away_team.team_name},
+            box.is_playoff,  # Using is_playoff as proxy since box doesn't have is_complete
+        ))
+    home_scores, away_scores, home_projs, away_projs = scores
+
+    # Calculate win probabilities for all matchups at once
+    home_win_probs, away_win_probs = calculate_win_probabilities(
+        home_scores, away_scores, home_projs, away_projs
+    )
+
+    # One row of plain floats per matchup for the response models
+    rows = np.column_stack(
+        (home_scores, away_scores, home_projs, away_projs, home_win_probs, away_win_probs)
+    ).tolist()
+
+    matchups_data = []
+    for i, ((home_team, away_team, is_complete), row) in enumerate(zip(teams, rows)):
+        home_score, away_score, home_proj, away_proj, home_win_prob, away_win_prob = row
+
+        matchup_data: MatchupData = {
+            "matchup_index": i,
+            "home_team": {**home_team, "current_score": home_score, "projected_score": home_proj},
+            "away_team": {**away_team, "current_score": away_score, "projected_score": away_proj},
+            "home_win_probability": home_win_prob,
+            "away_win_probability": away_win_prob,
+            "is_complete": is_complete,
+        }
+        matchups_data.append(matchup_data)
+
+    # Calculate live and projected medians across all teams
+    live_median = calculate_median(np.concatenate((home_scores, away_scores)))
+    projected_median = calculate_median(np.concatenate((home_projs, away_projs)))
+
+    return {
+        "matchups": matchups_data,
+        "week": current_week,
+        "league_name": league.settings.name,
+        "total_matchups": len(matchups_data),
+        "live_median": live_median,
+        "projected_median": projected_median,
+    }
+
+
+def build_slim_data(matrix_data: MatrixData) -> SlimMatrixData:
+    """
+    Strip matrix data down to the fields the matrix display uses
+    """
+    return {
+        "matchups": [
+            {
+                "matchup_index": matchup["matchup_index"],
+                "home_team": {
+                    "team_abbrev": matchup["home_team"]["team_abbrev"],
+                    "score_tenths": round(matchup["home_team"]["current_score"] * 10),
+                },
+                "away_team": {
+                    "team_abbrev": matchup["away_team"]["team_abbrev"],
+                    "score_tenths": round(matchup["away_team"]["current_score"] * 10),
+                },
+                "home_win_probability": matchup["home_win_probability"],
+            }
+            for matchup in matrix_data["matchups"]
+        ],
+        "week": matrix_data["week"],
+        "live_median_tenths": round(matrix_data["live_median"] * 10),
+        "projected_median_tenths": round(matrix_data["projected_median"] * 10),
+    }
+
+
+def build_summary_data(matrix_data: MatrixData) -> MatrixDataSummary:
+    """
+    Keep only the team identity for each matchup
+    """
+    return {
+        "matchups": [
+            {
+                "matchup_index": matchup["matchup_index"],
+                "home_team": {
+                    "team_id": matchup["home_team"]["team_id"],
+                    "team_abbrev": matchup["home_team"]["team_abbrev"],
+                    "team_name": matchup["home_team"]["team_name"],
+                },
+                "away_team": {
+                    "team_id": matchup["away_team"]["team_id"],
+                    "team_abbrev": matchup["away_team"]["team_abbrev"],
+                    "team_name": matchup["away_team"]["team_name"],
+                },
+            }
+            for matchup in matrix_data["matchups"]
+        ],
+        "week": matrix_data["week"],
+        "league_name": matrix_data["league_name"],
+    }
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching league data: {str(e)}")
+
+def build_scores_data(matrix_data: MatrixData) -> MatrixDataScores:
+    """
+    Keep only the live numbers, one array entry per matchup_index
+    """
+    matchups = matrix_data["matchups"]
+    return {
+        "week": matrix_data["week"],
+        "home_score_tenths": [round(matchup["home_team"]["current_score"] * 10) for matchup in matchups],
+        "away_score_tenths": [round(matchup["away_team"]["current_score"] * 10) for matchup in matchups],
+        "home_win_probability": [matchup["home_win_probability"] for matchup in matchups],
+        "live_median_tenths": round(matrix_data["live_median"] * 10),
+        "projected_median_tenths": round(matrix_data["projected_median"] * 10),
+    }
+
+
+def make_payload(data: MatrixData | SlimMatrixData | MatrixDataSummary | MatrixDataScores) -> Payload:
+    """
+    Serialize response data and derive an ETag from the bytes
+    The ETag is weak because GZipMiddleware serves other codings of the same body
+    """
+    body = orjson.dumps(data)
+    return Payload(body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+
+
+def build_snapshot(matrix_data: MatrixData) -> LeagueSnapshot:
+    """
+    Pre-serialize every response variant for a set of matrix data
+    """
+    return LeagueSnapshot(
+        matrix_data=matrix_data,
+        full=make_payload(matrix_data),
+        slim=make_payload(build_slim_data(matrix_data)),
+        summary=make_payload(build_summary_data(matrix_data)),
+        scores=make_payload(build_scores_data(matrix_data)),
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag, as GET requires
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def cached_response(request: Request, payload: Payload, max_age: int = REFRESH_INTERVAL) -> Response:
+    """
+    Return a payload with caching headers, or an empty 304 if the client already has it
+    """
+    headers = {"ETag": payload.etag, "Cache-Control": f"max-age={max_age}"}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
+
+
+def acquire_refresh_lock():
+    """
+    Try to become the worker that refreshes from ESPN; returns the held lock file or None
+    """
+    lock_file = open(f"{SNAPSHOT_PATH}.lock", "a")
+    if fcntl is None:
+        return lock_file
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def write_shared_snapshot(body: bytes) -> None:
+    """
+    Publish full matrix data JSON for the other workers, replacing the file atomically
+    """
+    temp_path = f"{SNAPSHOT_PATH}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(body)
+    os.replace(temp_path, SNAPSHOT_PATH)
+
+
+def write_shared_error(message: str | None) -> None:
+    """
+    Publish the refreshing worker's last error for the other workers, or clear it
+    """
+    error_path = f"{SNAPSHOT_PATH}.error"
+    if message is None:
+        with suppress(FileNotFoundError):
+            os.remove(error_path)
+        return
+    temp_path = f"{error_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(message)
+    os.replace(temp_path, error_path)
+
+
+def read_shared_error() -> str | None:
+    """
+    Load the error published by the refreshing worker, if there is one
+    """
+    try:
+        with open(f"{SNAPSHOT_PATH}.error") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def read_shared_snapshot(last_mtime: int | None, newer_than: int) -> tuple[MatrixData | None, int | None]:
+    """
+    Load matrix data published by the refreshing worker
+    Returns None if the file is unchanged since last_mtime or was written before newer_than
+    """
+    mtime = os.stat(SNAPSHOT_PATH).st_mtime_ns
+    if mtime == last_mtime or mtime < newer_than:
+        return None, last_mtime
+    with open(SNAPSHOT_PATH, "rb") as f:
+        return orjson.loads(f.read()), mtime
+
+
+async def refresh_snapshot_loop(app: FastAPI) -> None:
+    """
+    Rebuild the league snapshot every REFRESH_INTERVAL seconds
+    Only the worker holding the refresh lock calls ESPN; the others pick up its shared file
+    """
+    started = time.monotonic()
+    started_ns = time.time_ns()
+    while True:
+        try:
+            # Retried every cycle so another worker takes over if the refresher exits
+            if app.state.refresh_lock is None and not app.state.standalone:
+                try:
+                    app.state.refresh_lock = acquire_refresh_lock()
+                except OSError:
+                    # Without the shared files, fall back to refreshing from ESPN here
+                    logger.warning("Can't use %s, refreshing league data in this worker only", SNAPSHOT_PATH, exc_info=True)
+                    app.state.standalone = True
+
+            if app.state.standalone:
+                matrix_data = await asyncio.to_thread(build_matrix_data)
+                app.state.snapshot = build_snapshot(matrix_data)
+                app.state.refresh_error = None
+            elif app.state.refresh_lock is not None:
+                # ESPN calls are blocking, so keep them off the event loop
+                matrix_data = await asyncio.to_thread(build_matrix_data)
+                # Serialize and hash once per refresh so requests only copy bytes
+                app.state.snapshot = build_snapshot(matrix_data)
+                await asyncio.to_thread(write_shared_snapshot, app.state.snapshot.full.body)
+                await asyncio.to_thread(write_shared_error, None)
+                app.state.refresh_error = None
+            else:
+                # Ignore a file left over from a previous run until it is refreshed
+                newer_than = 0 if app.state.snapshot is not None else started_ns - REFRESH_INTERVAL * 1_000_000_000
+                with suppress(FileNotFoundError):
+                    matrix_data, app.state.shared_mtime = await asyncio.to_thread(
+                        read_shared_snapshot, app.state.shared_mtime, newer_than
+                    )
+                    if matrix_data is not None:
+                        app.state.snapshot = build_snapshot(matrix_data)
+                if app.state.snapshot is not None:
+                    app.state.refresh_error = None
+                elif time.monotonic() - started < REFRESH_INTERVAL:
+                    # The refreshing worker hasn't published yet; keep polling quietly
+                    await asyncio.sleep(SHARED_POLL_INTERVAL)
+                    continue
+                else:
+                    # Report why the refreshing worker has nothing to share, logging
+                    # only when that changes since followers poll every second
+                    error = await asyncio.to_thread(read_shared_error)
+                    error = error or "No league data shared by the refreshing worker"
+                    if error != app.state.refresh_error:
+                        logger.warning("Waiting for shared league data: %s", error)
+                    app.state.refresh_error = error
+        except Exception as e:
+            # Keep serving the last good snapshot until ESPN recovers
+            logger.exception("Error refreshing league data")
+            app.state.refresh_error = str(e)
+            if app.state.refresh_lock is not None:
+                with suppress(OSError):
+                    await asyncio.to_thread(write_shared_error, app.state.refresh_error)
+        app.state.first_refresh.set()
+        refreshing = app.state.refresh_lock is not None or app.state.standalone
+        await asyncio.sleep(REFRESH_INTERVAL if refreshing else SHARED_POLL_INTERVAL)
+
+
+async def get_snapshot() -> LeagueSnapshot:
+    """
+    Wait for the first refresh and return the latest snapshot, or raise if there is none yet
+    """
+    await app.state.first_refresh.wait()
+    snapshot = app.state.snapshot
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail=f"Error fetching league data: {app.state.refresh_error}")
+    return snapshot
+
+
+@app.get("/league/data", response_model=MatrixData | SlimMatrixData)
+async def get_league_data(request: Request, fields: Literal["full", "slim"] = "full") -> Response:
+    """
+    Serve the latest league snapshot built by the background refresher
+    Pass fields=slim for the reduced payload used by the matrix display
+    """
+    snapshot = await get_snapshot()
+    return cached_response(request, snapshot.slim if fields == "slim" else snapshot.full)
+
+
+@app.get("/league/summary", response_model=MatrixDataSummary)
+async def get_league_summary(request: Request) -> Response:
+    """
+    Serve team identity per matchup; it only changes when the week rolls over
+    """
+    snapshot = await get_snapshot()
+    return cached_response(request, snapshot.summary, max_age=LEAGUE_TTL)
+
+
+@app.get("/league/scores", response_model=MatrixDataScores)
+async def get_league_scores(request: Request) -> Response:
+    """
+    Serve live scores and win probabilities as arrays indexed by matchup_index
+    """
+    snapshot = await get_snapshot()
+    return cached_response(request, snapshot.scores)
 
 
 if __name__ == "__main__":
@@ -58,6 +58,49 @@ def test_league_data_endpoint():
         print(f"❌ League data endpoint failed: {e}")
         return False
 
+def test_league_data_etag():
+    """Test that the league data endpoint answers conditional requests"""
+    try:
+        response = requests.get(f"{API_BASE}/league/data", timeout=10)
+        etag = response.headers.get("ETag")
+        if response.status_code != 200 or not etag:
+            print(f"❌ League data ETag missing: {response.status_code}")
+            return False
+
+        response = requests.get(f"{API_BASE}/league/data", headers={"If-None-Match": etag}, timeout=10)
+        if response.status_code == 304:
+            print("✅ League data ETag working")
+            print(f"   ETag: {etag}")
+            return True
+        else:
+            print(f"❌ League data ETag failed: expected 304, got {response.status_code}")
+            return False
+    except requests.exceptions.RequestException as e:
+        print(f"❌ League data ETag failed: {e}")
+        return False
+
+def test_league_summary_and_scores():
+    """Test that the summary and scores endpoints describe the same matchups"""
+    try:
+        summary = requests.get(f"{API_BASE}/league/summary", timeout=10)
+        scores = requests.get(f"{API_BASE}/league/scores", timeout=10)
+        if summary.status_code != 200 or scores.status_code != 200:
+            print(f"❌ League summary/scores failed: {summary.status_code}, {scores.status_code}")
+            return False
+
+        matchups = len(summary.json().get("matchups", []))
+        home_scores = len(scores.json().get("home_score_tenths", []))
+        if matchups == home_scores:
+            print("✅ League summary and scores endpoints working")
+            print(f"   Matchups: {matchups}")
+            return True
+        else:
+            print(f"❌ League summary/scores mismatch: {matchups} matchups, {home_scores} scores")
+            return False
+    except requests.exceptions.RequestException as e:
+        print(f"❌ League summary/scores failed: {e}")
+        return False
+
 def main():
     print("Testing Fantasy Football Matrix API...")
     print(f"API Base URL: {API_BASE}")
@@ -70,7 +113,11 @@ def main():
     # Test league data (this will fail without proper .env setup)
     print("\nTesting league data endpoint...")
     print("(This will fail without proper ESPN league configuration)")
-    league_ok = test_league_data_endpoint()
+    league_ok = (
+        test_league_data_endpoint()
+        and test_league_data_etag()
+        and test_league_summary_and_scores()
+    )
     
     print("-" * 50)
     if health_ok and root_ok:
@@ -20,14 +20,22 @@ import neopixel
 # API Configuration
 API_HOST = os.getenv("API_HOST", "192.168.1.100")
 API_PORT = os.getenv("API_PORT", "8000")
-API_URL = f"http://{API_HOST}:{API_PORT}/league/data"
+API_BASE = f"http://{API_HOST}:{API_PORT}/league"
+SUMMARY_URL = f"{API_BASE}/summary"  # Team names, only change weekly
+SCORES_URL = f"{API_BASE}/scores"  # Live numbers as arrays by matchup_index
 
 # Display Configuration
 DISPLAY_TIME = 5  # seconds per matchup
 SUMMARY_DISPLAY_TIME = 5  # seconds for summary screen
 REFRESH_INTERVAL = 30  # seconds between API calls
+SUMMARY_REFRESH_INTERVAL = 3600  # seconds between team summary calls
 COLOR_ORDER = "RGB"  # RGB/RBG/BGR depending on panel type
 
+# Probability bar layout
+BAR_WIDTH = 64
+BAR_HEIGHT = 4
+BAR_Y = 24
+
 # Neon color sets for 6 matchups (home, away)
 MATCHUP_COLORS = [
     (0x00FFFF, 0xFF1493),  # Cyan vs Deep Pink
@@ -49,6 +57,13 @@ PROJ_LABEL_COLOR = 0x00FFFF     # Cyan
 PROJ_VALUE_COLOR = 0xFFFFFF     # White
 
 
+def format_tenths(tenths):
+    """Format an integer count of tenths as "xx.x" without float formatting"""
+    sign = "-" if tenths < 0 else ""
+    tenths = abs(tenths)
+    return sign + str(tenths // 10) + "." + str(tenths % 10)
+
+
 class FantasyMatrixDisplay:
     def __init__(self):
         """Initialize the MatrixPortal and display"""
@@ -72,12 +87,23 @@ class FantasyMatrixDisplay:
 
         self.display = self.matrixportal.display
         self.display.brightness = 0.8
+
+        # Build both screens once; each frame only updates them in place
+        self._create_matchup_group()
+        self._create_summary_group()
         self.group = self.display.root_group
 
         self.matchups = []
         self.current_matchup_index = 0
         self.last_api_call = 0
-        self.projected_median = 0.0
+        self.live_median = 0  # Tenths of a point
+        self.projected_median = 0  # Tenths of a point
+        self.summary = None  # Team identity per matchup from /league/summary
+        self.scores = None  # Latest arrays from /league/scores
+        self.last_summary_call = 0
+        self.summary_etag = None  # ETags of the last payloads, sent back as If-None-Match
+        self.scores_etag = None
+        self._prepare_summary()
 
         print("Matrix Portal initialized!")
     
@@ -99,28 +125,57 @@ class FantasyMatrixDisplay:
             self.status_pixel.fill(0x000000)
             return False
     
+    def _get_json(self, url, etag):
+        """GET a JSON endpoint, returning (data, etag) with data None if unchanged"""
+        print(f"Fetching data from: {url}")
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.requests.get(url, headers=headers, timeout=10)
+        try:
+            if response.status_code == 304:
+                return None, etag
+            elif response.status_code == 200:
+                return response.json(), response.headers.get("etag")
+            else:
+                raise RuntimeError(f"API error: {response.status_code}")
+        finally:
+            response.close()
+
+    def _fetch_summary(self, now):
+        """Fetch team identity, returning True if it changed"""
+        summary, self.summary_etag = self._get_json(SUMMARY_URL, self.summary_etag)
+        self.last_summary_call = now
+        if summary is None:
+            return False
+        self.summary = summary
+        return True
+
     def fetch_matchups(self):
         """Fetch fresh matchup data from API"""
         self.status_pixel.fill(0x0000FF)  # Blue while fetching
         try:
-            print(f"Fetching data from: {API_URL}")
-            response = self.requests.get(API_URL, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                self.matchups = data["matchups"]
-                self.projected_median = data.get("projected_median", 0.0)
-                print(f"Fetched {len(self.matchups)} matchups for Week {data['week']}")
-                self.status_pixel.fill(0x00FF00)  # Green flash on success
-                time.sleep(0.3)
-                self.status_pixel.fill(0x000000)
-                return True
+            now = time.monotonic()
+            changed = False
+            if self.summary is None or now - self.last_summary_call > SUMMARY_REFRESH_INTERVAL:
+                changed = self._fetch_summary(now)
+
+            scores, self.scores_etag = self._get_json(SCORES_URL, self.scores_etag)
+            if scores is not None:
+                self.scores = scores
+                changed = True
+
+            # A new week brings new pairings, so the summary is stale too
+            if self.scores["week"] != self.summary["week"]:
+                changed = self._fetch_summary(now) or changed
+
+            if changed:
+                self._merge_matchups()
+                print(f"Fetched {len(self.matchups)} matchups for Week {self.scores['week']}")
             else:
-                print(f"API error: {response.status_code}")
-                self.status_pixel.fill(0xFF0000)  # Red on error
-                time.sleep(0.5)
-                self.status_pixel.fill(0x000000)
-                return False
+                print("Data unchanged since last fetch")
+            self.status_pixel.fill(0x00FF00)  # Green flash on success
+            time.sleep(0.3)
+            self.status_pixel.fill(0x000000)
+            return True
 
         except Exception as e:
             print(f"Network error: {e}")
@@ -128,158 +183,185 @@ class FantasyMatrixDisplay:
             time.sleep(0.5)
             self.status_pixel.fill(0x000000)
             return False
-        finally:
-            response.close() if 'response' in locals() else None
-    
-    def create_matchup_display(self, matchup):
-        """Create display elements for a single matchup"""
-        home = matchup["home_team"]
-        away = matchup["away_team"]
-        home_prob = round(matchup["home_win_probability"] * 100)
-        
-        # Get colors for this matchup
-        matchup_idx = matchup.get("matchup_index", 0) % len(MATCHUP_COLORS)
-        home_color, away_color = MATCHUP_COLORS[matchup_idx]
 
-        # Determine score colors based on who's winning
-        home_score_val = home['current_score']
-        away_score_val = away['current_score']
-        
-        if home_score_val > away_score_val:
-            home_score_color, away_score_color = WINNING_SCORE_COLOR, LOSING_SCORE_COLOR
-        elif away_score_val > home_score_val:
-            home_score_color, away_score_color = LOSING_SCORE_COLOR, WINNING_SCORE_COLOR
-        else:
-            home_score_color = away_score_color = LOSING_SCORE_COLOR
-
-        # Calculate probability bar dimensions
-        bar_width = 64
-        bar_height = 4
-        bar_y = 24
-        home_bar_width = int((home_prob / 100) * bar_width)
-
-        # Create display group
-        new_group = displayio.Group()
+    def _merge_matchups(self):
+        """Combine the summary and score arrays into one dict per matchup"""
+        scores = self.scores
+        self.matchups = [
+            {
+                "matchup_index": matchup["matchup_index"],
+                "home_team": {"team_abbrev": matchup["home_team"]["team_abbrev"], "score_tenths": home_score},
+                "away_team": {"team_abbrev": matchup["away_team"]["team_abbrev"], "score_tenths": away_score},
+                "home_win_probability": home_prob,
+            }
+            for matchup, home_score, away_score, home_prob in zip(
+                self.summary["matchups"],
+                scores["home_score_tenths"],
+                scores["away_score_tenths"],
+                scores["home_win_probability"],
+            )
+        ]
+        self.live_median = scores["live_median_tenths"]
+        self.projected_median = scores["projected_median_tenths"]
+        self._prepare_matchups()
+        self._prepare_summary()
+
+    def _create_matchup_group(self):
+        """Create the reusable display elements for the matchup screen"""
+        self._matchup_group = displayio.Group()
 
         # Team names
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text=home["team_abbrev"],
-            color=home_color,
-            x=0, y=6
-        ))
-        
-        away_x = max(0, 64 - (len(away["team_abbrev"]) * 6))
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text=away["team_abbrev"],
-            color=away_color,
-            x=away_x, y=6
-        ))
+        self._home_label = label.Label(terminalio.FONT, text="", x=0, y=6)
+        self._away_label = label.Label(terminalio.FONT, text="", x=0, y=6)
 
         # Scores
-        home_score_text = f"{home_score_val:.1f}"
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text=home_score_text,
-            color=home_score_color,
-            x=0, y=16
-        ))
+        self._home_score_label = label.Label(terminalio.FONT, text="", x=0, y=16)
+        self._away_score_label = label.Label(terminalio.FONT, text="", x=0, y=16)
 
-        away_score_text = f"{away_score_val:.1f}"
-        away_score_x = max(0, 64 - (len(away_score_text) * 6))
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text=away_score_text,
-            color=away_score_color,
-            x=away_score_x, y=16
-        ))
+        # Probability bars: the away bar spans the full width and the
+        # home bar slides over it from the left, so neither is resized
+        self._away_bar = Rect(x=0, y=BAR_Y, width=BAR_WIDTH, height=BAR_HEIGHT, fill=0x000000)
+        self._home_bar = Rect(x=-BAR_WIDTH, y=BAR_Y, width=BAR_WIDTH, height=BAR_HEIGHT, fill=0x000000)
 
-        # Probability bars
-        new_group.append(Rect(
-            x=0, y=bar_y,
-            width=home_bar_width,
-            height=bar_height,
-            fill=home_color
-        ))
-        
-        new_group.append(Rect(
-            x=home_bar_width, y=bar_y,
-            width=bar_width - home_bar_width,
-            height=bar_height,
-            fill=away_color
-        ))
+        for element in (
+            self._home_label,
+            self._away_label,
+            self._home_score_label,
+            self._away_score_label,
+            self._away_bar,
+            self._home_bar,
+        ):
+            self._matchup_group.append(element)
 
-        self.display.root_group = new_group
-        self.group = new_group
+    def _create_summary_group(self):
+        """Create the reusable display elements for the summary screen"""
+        self._summary_group = displayio.Group()
 
-        print(f"Displaying: {home['team_abbrev']} vs {away['team_abbrev']} ({home_prob}%-{100-home_prob}%)")
-    
-    def create_summary_display(self):
-        """Create summary screen with live vs projected median"""
-        # Calculate live median from all teams
-        all_scores = []
-        
-        for matchup in self.matchups:
-            home = matchup["home_team"]
-            away = matchup["away_team"]
-            all_scores.append(home['current_score'])
-            all_scores.append(away['current_score'])
-        
-        # Calculate live median
-        sorted_scores = sorted(all_scores)
-        n = len(sorted_scores)
-        live_median = sorted_scores[n // 2] if n % 2 else (sorted_scores[n // 2 - 1] + sorted_scores[n // 2]) / 2
-        
-        # Create display group
-        new_group = displayio.Group()
-        
         # Title: MEDIAN (centered at top)
         title_text = "MEDIAN"
         title_x = (64 - (len(title_text) * 6)) // 2
-        new_group.append(label.Label(
+        self._summary_group.append(label.Label(
             terminalio.FONT,
             text=title_text,
             color=MEDIAN_TITLE_COLOR,
             x=title_x, y=6
         ))
-        
+
         # LIVE: xx.x
-        live_text = f"LIVE: {live_median:.1f}"
-        live_x = (64 - (len(live_text) * 6)) // 2
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text="LIVE:",
-            color=LIVE_LABEL_COLOR,
-            x=live_x, y=16
-        ))
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text=f"{live_median:.1f}",
-            color=LIVE_VALUE_COLOR,
-            x=live_x + 30, y=16
-        ))
+        self._live_label = label.Label(terminalio.FONT, text="LIVE:", color=LIVE_LABEL_COLOR, y=16)
+        self._live_value_label = label.Label(terminalio.FONT, text="", color=LIVE_VALUE_COLOR, y=16)
+
+        # PROJ: xx.x
+        self._proj_label = label.Label(terminalio.FONT, text="PROJ:", color=PROJ_LABEL_COLOR, y=26)
+        self._proj_value_label = label.Label(terminalio.FONT, text="", color=PROJ_VALUE_COLOR, y=26)
+
+        for element in (
+            self._live_label,
+            self._live_value_label,
+            self._proj_label,
+            self._proj_value_label,
+        ):
+            self._summary_group.append(element)
+
+    def _show_group(self, group):
+        """Switch the display to a pre-built screen"""
+        if self.display.root_group is not group:
+            self.display.root_group = group
+        self.group = group
+
+    def _prepare_matchups(self):
+        """Precompute colors, text and positions once per fetch instead of per frame"""
+        for matchup in self.matchups:
+            home = matchup["home_team"]
+            away = matchup["away_team"]
+            home_prob = round(matchup["home_win_probability"] * 100)
+
+            # Get colors for this matchup
+            matchup_idx = matchup.get("matchup_index", 0) % len(MATCHUP_COLORS)
+            matchup["_home_color"], matchup["_away_color"] = MATCHUP_COLORS[matchup_idx]
+
+            # Determine score colors based on who's winning
+            home_score_val = home['score_tenths']
+            away_score_val = away['score_tenths']
+
+            if home_score_val > away_score_val:
+                home_score_color, away_score_color = WINNING_SCORE_COLOR, LOSING_SCORE_COLOR
+            elif away_score_val > home_score_val:
+                home_score_color, away_score_color = LOSING_SCORE_COLOR, WINNING_SCORE_COLOR
+            else:
+                home_score_color = away_score_color = LOSING_SCORE_COLOR
+            matchup["_home_score_color"] = home_score_color
+            matchup["_away_score_color"] = away_score_color
+
+            # Text and right-aligned x positions
+            matchup["_away_x"] = max(0, 64 - (len(away["team_abbrev"]) * 6))
+            matchup["_home_score_text"] = format_tenths(home_score_val)
+            away_score_text = format_tenths(away_score_val)
+            matchup["_away_score_text"] = away_score_text
+            matchup["_away_score_x"] = max(0, 64 - (len(away_score_text) * 6))
+
+            # Probability bar split
+            matchup["_home_prob"] = home_prob
+            matchup["_home_bar_width"] = int((home_prob / 100) * BAR_WIDTH)
+
+    def _prepare_summary(self):
+        """Precompute summary screen text and positions once per fetch"""
+        # LIVE: xx.x
+        self._live_value_text = format_tenths(self.live_median)
+        self._live_x = (64 - ((len(self._live_value_text) + 6) * 6)) // 2
+
+        # PROJ: xx.x
+        self._proj_value_text = format_tenths(self.projected_median)
+        self._proj_x = (64 - ((len(self._proj_value_text) + 6) * 6)) // 2 + 1  # Add 1 pixel offset
+
+    def create_matchup_display(self, matchup):
+        """Update the matchup screen for a single matchup"""
+        home = matchup["home_team"]
+        away = matchup["away_team"]
+        home_color = matchup["_home_color"]
+        away_color = matchup["_away_color"]
+
+        # Team names
+        self._home_label.text = home["team_abbrev"]
+        self._home_label.color = home_color
+
+        self._away_label.text = away["team_abbrev"]
+        self._away_label.color = away_color
+        self._away_label.x = matchup["_away_x"]
+
+        # Scores
+        self._home_score_label.text = matchup["_home_score_text"]
+        self._home_score_label.color = matchup["_home_score_color"]
+
+        self._away_score_label.text = matchup["_away_score_text"]
+        self._away_score_label.color = matchup["_away_score_color"]
+        self._away_score_label.x = matchup["_away_score_x"]
+
+        # Probability bars
+        self._away_bar.fill = away_color
+        self._home_bar.fill = home_color
+        self._home_bar.x = matchup["_home_bar_width"] - BAR_WIDTH
+
+        self._show_group(self._matchup_group)
+
+        home_prob = matchup["_home_prob"]
+        print(f"Displaying: {home['team_abbrev']} vs {away['team_abbrev']} ({home_prob}%-{100-home_prob}%)")
+    
+    def create_summary_display(self):
+        """Update the summary screen with live vs projected median"""
+        # LIVE: xx.x
+        self._live_label.x = self._live_x
+        self._live_value_label.text = self._live_value_text
+        self._live_value_label.x = self._live_x + 30
         
         # PROJ: xx.x
-        proj_text = f"PROJ: {self.projected_median:.1f}"
-        proj_x = (64 - (len(proj_text) * 6)) // 2 + 1  # Add 1 pixel offset
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text="PROJ:",
-            color=PROJ_LABEL_COLOR,
-            x=proj_x, y=26
-        ))
-        new_group.append(label.Label(
-            terminalio.FONT,
-            text=f"{self.projected_median:.1f}",
-            color=PROJ_VALUE_COLOR,
-            x=proj_x + 30, y=26
-        ))
+        self._proj_label.x = self._proj_x
+        self._proj_value_label.text = self._proj_value_text
+        self._proj_value_label.x = self._proj_x + 30
         
-        self.display.root_group = new_group
-        self.group = new_group
+        self._show_group(self._summary_group)
         
-        print(f"Summary: Live Median={live_median:.1f}, Projected Median={self.projected_median:.1f}")
+        print(f"Summary: Live Median={self._live_value_text}, Projected Median={self._proj_value_text}")
     
     def run(self, wifi_ssid, wifi_password):
         """Main display loop"""
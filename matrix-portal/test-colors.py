@@ -1,80 +1,116 @@
 """
 Test if BLUE channel only works on half the screen
 """
-from adafruit_matrixportal.matrixportal import MatrixPortal
-from adafruit_display_text import label
+import bitmaptools
+import board
+import gc
+import displayio
+import framebufferio
+import rgbmatrix
+import supervisor
+from adafruit_display_text import bitmap_label
 import terminalio
 import time
+from micropython import const
+
+# Don't restart the test when files on CIRCUITPY change; reset the board to rerun
+supervisor.runtime.autoreload = False
 
 COLOR_ORDER = "RGB"
+# const() values with leading underscores are inlined by the compiler
+_BLUE = const(0x0000FF)  # Only color under test, stored once in the shared palette
+_X = const(2)
+_Y1 = const(4)
+_Y2 = const(10)
+_Y3 = const(16)
+_Y4 = const(22)
+_Y5 = const(28)
+
+
+def rasterize(dest, positions):
+    """Blit each (text, y) string into dest at x=_X"""
+    # Locals so the loop doesn't repeat global and attribute lookups
+    make_label = bitmap_label.Label
+    font = terminalio.FONT
+    blit = bitmaptools.blit
+    for text, y in positions:
+        # Text pixels are palette index 1, so the label's own color is never used.
+        # save_text=False drops the string once it has been rasterized
+        text_label = make_label(font, text=text, x=_X, y=y, save_text=False)
+        # Copy only the text pixels, clipping anything above or left of the screen
+        left = text_label.x + text_label.tilegrid.x
+        top = text_label.y + text_label.tilegrid.y
+        blit(
+            dest, text_label.bitmap, max(left, 0), max(top, 0),
+            x1=max(-left, 0), y1=max(-top, 0), skip_source_index=0,
+        )
+
 
-print(f"Testing BLUE on different parts of screen with order: {COLOR_ORDER}")
+# Drive the panel with the built-in modules only; adafruit_matrixportal
+# would also import its networking and portal libraries
+displayio.release_displays()
 
-# Initialize display
-matrixportal = MatrixPortal(
+# Upper and lower half RGB pins; like adafruit_matrixportal, slot k gets the
+# pin at the position of "RGB"[k] in COLOR_ORDER, so this matches code.py
+_ORDER = COLOR_ORDER.upper()
+_UPPER = (board.MTX_R1, board.MTX_G1, board.MTX_B1)
+_LOWER = (board.MTX_R2, board.MTX_G2, board.MTX_B2)
+matrix = rgbmatrix.RGBMatrix(
     width=64,
     height=32,
-    bit_depth=4,
-    color_order=COLOR_ORDER,
-    status_neopixel=None,
+    bit_depth=4,  # Same as code.py so the test reproduces what the real display does
+    rgb_pins=[pins[_ORDER.index(c)] for pins in (_UPPER, _LOWER) for c in "RGB"],
+    addr_pins=[board.MTX_ADDRA, board.MTX_ADDRB, board.MTX_ADDRC, board.MTX_ADDRD],
+    clock_pin=board.MTX_CLK,
+    latch_pin=board.MTX_LAT,
+    output_enable_pin=board.MTX_OE,
 )
 
-matrixportal.display.brightness = 0.8
-group = matrixportal.display.root_group
+display = framebufferio.FramebufferDisplay(matrix)
+group = displayio.Group()
+display.root_group = group
 
 # All BLUE text at different positions
-# Top of screen
-label1 = label.Label(
-    terminalio.FONT,
-    text="BLUE1",
-    color=0x0000FF,
-    x=2, y=4
+_POSITIONS = (
+    ("BLUE1", _Y1),  # Top of screen
+    ("BLUE2", _Y2),  # Quarter screen
+    ("BLUE3", _Y3),  # Half screen
+    ("BLUE4", _Y4),  # Three-quarter screen
+    ("BLUE5", _Y5),  # Bottom of screen
 )
-group.append(label1)
 
-# Quarter screen
-label2 = label.Label(
-    terminalio.FONT,
-    text="BLUE2",
-    color=0x0000FF,
-    x=2, y=10
-)
-group.append(label2)
+# Rasterize every label into one shared bitmap so displayio composites a
+# single TileGrid and palette instead of one per label
+bitmap = displayio.Bitmap(64, 32, 2)
+palette = displayio.Palette(2)
+palette[0] = 0x000000
+palette[1] = _BLUE
+palette.make_transparent(0)
 
-# Half screen
-label3 = label.Label(
-    terminalio.FONT,
-    text="BLUE3",
-    color=0x0000FF,
-    x=2, y=16
-)
-group.append(label3)
+# Collect once up front and hold off GC during the burst of label allocations
+gc.collect()
+gc.disable()
 
-# Three-quarter screen
-label4 = label.Label(
-    terminalio.FONT,
-    text="BLUE4",
-    color=0x0000FF,
-    x=2, y=22
-)
-group.append(label4)
+rasterize(bitmap, _POSITIONS)
+group.append(displayio.TileGrid(bitmap, pixel_shader=palette))
 
-# Bottom of screen
-label5 = label.Label(
-    terminalio.FONT,
-    text="BLUE5",
-    color=0x0000FF,
-    x=2, y=28
-)
-group.append(label5)
+# Free the temporary labels before idling
+gc.collect()
+gc.enable()
 
-print("\nShowing 5 BLUE labels at different Y positions:")
-print("  BLUE1 at y=4")
-print("  BLUE2 at y=10")
-print("  BLUE3 at y=16 (middle)")
-print("  BLUE4 at y=22")
-print("  BLUE5 at y=28")
-print("\nCheck if blue appears on all of them or only some!")
+# Only talk to the serial console if something is listening, and in one write
+if supervisor.runtime.serial_connected:
+    print(
+        f"Testing BLUE on different parts of screen with order: {COLOR_ORDER}\n"
+        "\nShowing 5 BLUE labels at different Y positions:\n"
+        "  BLUE1 at y=4\n"
+        "  BLUE2 at y=10\n"
+        "  BLUE3 at y=16 (middle)\n"
+        "  BLUE4 at y=22\n"
+        "  BLUE5 at y=28\n"
+        "\nCheck if blue appears on all of them or only some!"
+    )
 
+# displayio keeps refreshing the panel on its own; just park the CPU
 while True:
-    time.sleep(1)
+    time.sleep(3600)